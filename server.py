@@ -9,98 +9,346 @@ Allows listing and updating predictions with natural language descriptions.
 import asyncio
 import logging
 import os
-from typing import Any, Optional, List, Dict
-from dotenv import load_dotenv
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache, cached_property
+from itertools import islice
+from typing import Any, AsyncIterator, Optional, List, Dict
 
 import httpx
+import ijson
+import numpy as np
+import orjson
+from rapidfuzz import fuzz, process
+from rapidfuzz.utils import default_process
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.types import Tool, TextContent
 
-# Load environment variables from .env file
-load_dotenv()
-
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("fatebook-mcp")
 
 # Fatebook API configuration
 FATEBOOK_BASE_URL = "https://fatebook.io/api"
-# API key from environment variable (required)
-API_KEY = os.environ.get("FATEBOOK_API_KEY")
 
-if not API_KEY:
-    raise ValueError("FATEBOOK_API_KEY environment variable is required. Please set it in your .env file or environment.")
+# Fields the list view actually renders; sent as a projection hint so the
+# API can trim the payload (a no-op if the endpoint ignores unknown params)
+_LIST_FIELDS = "id,title,createdDate,resolveBy,resolved,user.name,forecasts"
+
+# Shared fallbacks for absent fields; dict.get's default argument is
+# evaluated on every call, so a literal {} there allocates each time
+_EMPTY: Dict[str, Any] = {}
+
+# Per-question listing template, hoisted so the format string is parsed at
+# one call site instead of once per question per render
+_Q_FMT = (
+    "{i}. **{title}**\n"
+    "   Author: {author}\n"
+    "   ID: {qid}\n"
+    "   Latest forecast: {fc}{fcr}\n"
+    "   Resolves by: {rb}\n"
+    "   Created: {cd}\n\n"
+)
 
 def format_forecast(forecast_value):
     """Safely format a forecast value"""
-    if isinstance(forecast_value, (int, float)):
+    # Fast path for the numeric common case; the isinstance check would cost
+    # more than the try on every call in the O(n) listing loops
+    try:
         return f"{forecast_value * 100:.1f}%"
-    else:
+    except (TypeError, ValueError):
         return str(forecast_value)
 
+def _latest_forecast_str(q: Dict[str, Any], _g=dict.get, _ff=format_forecast) -> str:
+    """Latest forecast of a question as a percentage string.
+
+    The default args bind dict.get and format_forecast at definition time,
+    so each call does LOAD_FAST instead of global/attribute lookups - this
+    runs once per question in every listing-style render.
+    """
+    forecasts = _g(q, "forecasts")
+    if not forecasts or forecasts[-1] is None:
+        return "No forecast"
+    return _ff(_g(forecasts[-1], "forecast", 0))
+
+def _format_question(i: int, q: Dict[str, Any], _ff=format_forecast) -> str:
+    """Render one question as a listing entry"""
+    g = q.get
+    latest_forecast = "No forecast"
+    latest_forecaster = ""
+    forecasts = g("forecasts") or ()
+    if forecasts:
+        latest = forecasts[-1]
+        if latest:
+            latest_forecast = _ff(latest.get('forecast', 0))
+            # Note who made the latest forecast (may be any user)
+            u = latest.get("user")
+            if u:
+                latest_forecaster = f" (by {u.get('name') or 'unknown'})"
+
+    return _Q_FMT.format_map({
+        "i": i,
+        "title": g("title") or "No title",
+        "author": (g("user") or _EMPTY).get("name") or "Unknown author",
+        "qid": g("id") or "No ID",
+        "fc": latest_forecast,
+        "fcr": latest_forecaster,
+        "rb": g("resolveBy") or "No resolution date",
+        "cd": g("createdDate") or "Unknown date",
+    })
+
+@dataclass
+class QuestionSet:
+    """A fetched batch of questions plus lazily-built lookup structures.
+
+    Instances live in the listing cache, so the title list and id index are
+    computed at most once per fetch no matter how many searches or lookups
+    hit the same batch.
+    """
+    questions: List[Dict[str, Any]]
+
+    @cached_property
+    def titles(self) -> List[str]:
+        # Index-aligned with questions so a match index maps straight back
+        return [(q.get("title") or "") if q is not None else "" for q in self.questions]
+
+    @cached_property
+    def by_id(self) -> Dict[str, Dict[str, Any]]:
+        return {q["id"]: q for q in self.questions if q is not None and q.get("id")}
+
+class _AsyncByteReader:
+    """Minimal async file-like wrapper over an httpx byte iterator.
+
+    ijson only accepts sources exposing a (sync or async) read method, not
+    bare async iterables; this adapts response.aiter_bytes() to that
+    protocol. The requested size is advisory for ijson, so each read just
+    hands over the next chunk, with b"" signalling EOF.
+    """
+
+    def __init__(self, aiter: AsyncIterator[bytes]):
+        self._aiter = aiter
+
+    async def read(self, n: int = -1) -> bytes:
+        if n == 0:
+            # ijson probes with read(0) to sniff str vs bytes and discards
+            # the result, so it must not consume a chunk
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
 class FatebookClient:
     """Client for interacting with the Fatebook API"""
-    
+
+    # Question lookups are cached briefly so repeated calls in a session
+    # (e.g. reviewing then updating the same prediction) skip the round-trip
+    QUESTION_CACHE_TTL = 30.0  # seconds
+    QUESTION_CACHE_MAX_SIZE = 256
+
+    # Listings are cached even more briefly: agents often re-request the same
+    # listing within seconds ("show me again"), but it must go stale quickly
+    LISTING_CACHE_TTL = 15.0  # seconds
+    LISTING_CACHE_MAX_SIZE = 32
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = httpx.AsyncClient()
+        # All requests go to fatebook.io, so one HTTP/2 connection can
+        # multiplex back-to-back tool calls without extra TLS handshakes
+        self.client = httpx.AsyncClient(
+            http2=True,
+            base_url=FATEBOOK_BASE_URL,
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                keepalive_expiry=60.0,
+            ),
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            headers={"Accept-Encoding": "gzip, br"},
+        )
+        self._q_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._list_cache: OrderedDict[tuple, tuple[float, List[Dict[str, Any]]]] = OrderedDict()
     
     async def get_questions(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get list of questions from Fatebook"""
         return await self.get_questions_with_params(limit=limit)
     
-    async def get_questions_with_params(
-        self, 
-        limit: int = 50,
-        resolved: Optional[bool] = None,
-        unresolved: Optional[bool] = None,
-        show_all_public: bool = False
-    ) -> List[Dict[str, Any]]:
-        """Get list of questions from Fatebook"""
-        url = f"{FATEBOOK_BASE_URL}/v0/getQuestions"
-        params = {"apiKey": self.api_key, "limit": limit}
-        
+    def _questions_params(
+        self,
+        limit: int,
+        resolved: Optional[bool],
+        unresolved: Optional[bool],
+        show_all_public: bool,
+        filter_tag_ids: Optional[List[str]],
+        fields: Optional[str],
+        sort_earliest_first: bool,
+        search_string: Optional[str]
+    ) -> List[tuple]:
+        """Build query params for the getQuestions endpoint.
+
+        Returned as (name, value) pairs - the form httpx's URL encoder
+        consumes directly, with repeated filterTagIds entries appended
+        flat instead of nested in a list value.
+        """
+        params: List[tuple] = [("apiKey", self.api_key), ("limit", limit)]
+
+        if search_string:
+            params.append(("searchString", search_string))
         if resolved is not None:
-            params["resolved"] = "true" if resolved else "false"
+            params.append(("resolved", "true" if resolved else "false"))
         if unresolved is not None:
-            params["unresolved"] = "true" if unresolved else "false"
+            params.append(("unresolved", "true" if unresolved else "false"))
         if show_all_public:
-            params["showAllPublic"] = "true"
-        
+            params.append(("showAllPublic", "true"))
+        if sort_earliest_first:
+            params.append(("sortEarliestFirst", "true"))
+        if filter_tag_ids:
+            params.extend(("filterTagIds", tag_id) for tag_id in filter_tag_ids)
+        if fields:
+            params.append(("fields", fields))
+        return params
+
+    @staticmethod
+    def _listing_key(params: List[tuple]) -> tuple:
+        """Hashable cache key for a getQuestions param set.
+
+        Param order is deterministic (fixed construction order), so the
+        tuple of pairs is directly usable as a key.
+        """
+        return tuple(params)
+
+    def _cached_listing(self, key: tuple) -> Optional[QuestionSet]:
+        cached = self._list_cache.get(key)
+        if cached is None:
+            return None
+        ts, question_set = cached
+        if time.monotonic() - ts < self.LISTING_CACHE_TTL:
+            self._list_cache.move_to_end(key)
+            return question_set
+        del self._list_cache[key]
+        return None
+
+    def _store_listing(self, key: tuple, question_set: QuestionSet) -> None:
+        self._list_cache[key] = (time.monotonic(), question_set)
+        if len(self._list_cache) > self.LISTING_CACHE_MAX_SIZE:
+            self._list_cache.popitem(last=False)
+
+    async def get_question_set_with_params(
+        self,
+        limit: int = 50,
+        resolved: Optional[bool] = None,
+        unresolved: Optional[bool] = None,
+        show_all_public: bool = False,
+        filter_tag_ids: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        sort_earliest_first: bool = False,
+        search_string: Optional[str] = None
+    ) -> QuestionSet:
+        """Get a QuestionSet from Fatebook (cached briefly per param set)"""
+        url = "/v0/getQuestions"
+        params = self._questions_params(limit, resolved, unresolved, show_all_public, filter_tag_ids, fields, sort_earliest_first, search_string)
+        key = self._listing_key(params)
+        cached = self._cached_listing(key)
+        if cached is not None:
+            return cached
+
+        response = None
         try:
             response = await self.client.get(url, params=params)
             response.raise_for_status()
-            data = response.json()
-            logger.info(f"API Response: {response.status_code}")
-            logger.info(f"Response data keys: {list(data.keys())}")
+            data = orjson.loads(response.content)
             # The API returns questions under 'items' key, not 'questions'
-            questions = data.get("items", [])
-            logger.info(f"Questions returned: {len(questions)}")
-            return questions
+            questions = data.get("items") or []
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API %s keys=%s n=%d", response.status_code, list(data), len(questions))
+            question_set = QuestionSet(questions)
+            self._store_listing(key, question_set)
+            return question_set
+        except httpx.HTTPStatusError as e:
+            # Bound the bytes-to-str cost; .text would decode the whole body
+            body = response.content[:512].decode("utf-8", "replace")
+            logger.error(f"Error fetching questions: {e}")
+            logger.error(f"Response text: {body}")
+            return QuestionSet([])
         except Exception as e:
+            # Connection-level failures never bind a response
             logger.error(f"Error fetching questions: {e}")
-            logger.error(f"Response status: {getattr(response, 'status_code', 'N/A')}")
-            if hasattr(response, 'text'):
-                logger.error(f"Response text: {response.text}")
-            return []
+            if response is not None:
+                logger.error(f"Response status: {response.status_code}")
+            return QuestionSet([])
+
+    async def get_questions_with_params(self, **kwargs) -> List[Dict[str, Any]]:
+        """Get list of questions from Fatebook (cached briefly per param set)"""
+        return (await self.get_question_set_with_params(**kwargs)).questions
     
+    async def iter_questions_with_params(
+        self,
+        limit: int = 50,
+        resolved: Optional[bool] = None,
+        unresolved: Optional[bool] = None,
+        show_all_public: bool = False,
+        filter_tag_ids: Optional[List[str]] = None,
+        fields: Optional[str] = None,
+        sort_earliest_first: bool = False,
+        search_string: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream questions from Fatebook one at a time.
+
+        Parses the response incrementally with ijson so only the current
+        question dict is live, keeping peak memory flat for large listings.
+        """
+        url = "/v0/getQuestions"
+        params = self._questions_params(limit, resolved, unresolved, show_all_public, filter_tag_ids, fields, sort_earliest_first, search_string)
+        key = self._listing_key(params)
+        cached = self._cached_listing(key)
+        if cached is not None:
+            for question in cached.questions:
+                yield question
+            return
+
+        questions: List[Dict[str, Any]] = []
+        try:
+            async with self.client.stream("GET", url, params=params) as response:
+                response.raise_for_status()
+                reader = _AsyncByteReader(response.aiter_bytes())
+                async for question in ijson.items(reader, "items.item"):
+                    questions.append(question)
+                    yield question
+        except Exception as e:
+            logger.error(f"Error streaming questions: {e}")
+            return
+        self._store_listing(key, QuestionSet(questions))
+
     async def get_question_by_id(self, question_id: str) -> Optional[Dict[str, Any]]:
-        """Get a specific question by ID"""
-        url = f"{FATEBOOK_BASE_URL}/v0/getQuestion"
+        """Get a specific question by ID (cached briefly to avoid repeat round-trips)"""
+        cached = self._q_cache.get(question_id)
+        if cached is not None:
+            ts, question = cached
+            if time.monotonic() - ts < self.QUESTION_CACHE_TTL:
+                self._q_cache.move_to_end(question_id)
+                return question
+            del self._q_cache[question_id]
+
+        url = "/v0/getQuestion"
         params = {"apiKey": self.api_key, "questionId": question_id}
-        
+
         try:
             response = await self.client.get(url, params=params)
             response.raise_for_status()
-            return response.json()
+            question = orjson.loads(response.content)
+            self._q_cache[question_id] = (time.monotonic(), question)
+            if len(self._q_cache) > self.QUESTION_CACHE_MAX_SIZE:
+                self._q_cache.popitem(last=False)
+            return question
         except Exception as e:
             logger.error(f"Error fetching question {question_id}: {e}")
             return None
     
     async def add_forecast(self, question_id: str, forecast: float, comment: str = "") -> bool:
         """Add a forecast to a question"""
-        url = f"{FATEBOOK_BASE_URL}/v0/addForecast"
+        url = "/v0/addForecast"
         data = {
             "apiKey": self.api_key,
             "questionId": question_id,
@@ -110,176 +358,356 @@ class FatebookClient:
             data["comment"] = comment
         
         try:
-            response = await self.client.post(url, json=data)
+            response = await self.client.post(
+                url,
+                content=orjson.dumps(data),
+                headers={"content-type": "application/json"},
+            )
             response.raise_for_status()
+            # Drop cached copies so the new forecast is visible immediately;
+            # the new forecast may appear in any cached filter view
+            self.invalidate_question(question_id)
+            self._list_cache.clear()
             return True
         except Exception as e:
             logger.error(f"Error adding forecast to {question_id}: {e}")
             return False
     
+    def invalidate_question(self, question_id: str) -> None:
+        """Drop any cached copy of a question"""
+        self._q_cache.pop(question_id, None)
+
     async def close(self):
         """Close the HTTP client"""
         await self.client.aclose()
 
-# Initialize the Fatebook client
-fatebook_client = FatebookClient(API_KEY)
+class PredictionMatcher:
+    """Matches natural language descriptions to prediction titles"""
+
+    def __init__(self):
+        # Preprocessed titles keyed by raw title; questions come from the
+        # listing cache, so the same titles recur across searches and the
+        # lowercase/strip pass is paid once per title instead of per query
+        self._processed_titles: Dict[str, str] = {}
+
+    def _processed(self, title: str) -> str:
+        processed = self._processed_titles.get(title)
+        if processed is None:
+            processed = self._processed_titles[title] = default_process(title)
+        return processed
+
+    def find_matching_predictions(
+        self,
+        description: str,
+        question_set: QuestionSet,
+        threshold: int = 60
+    ) -> List[tuple[Dict[str, Any], float]]:
+        """Find the questions whose titles best match a description.
+
+        Uses RapidFuzz's C++ token_set_ratio scorer with the cutoff pushed
+        down into the scoring loop, so non-matches are pruned cheaply.
+        Returns (question, score) pairs; the question dicts are the cached
+        API objects themselves, not copies, and must not be mutated.
+        """
+        questions = question_set.questions
+        if not questions:
+            return []
+
+        desc = default_process(description)
+        # titles is built once per cached QuestionSet and index-aligned
+        choices = [self._processed(t) for t in question_set.titles]
+
+        # Most queries are answered by a literal hit; only pay for the
+        # Levenshtein-based scorer on the residual
+        if desc:
+            literal = []
+            for idx, title in enumerate(choices):
+                if title and (desc in title or title in desc):
+                    literal.append((questions[idx], 100.0))
+                    if len(literal) == 2:
+                        break
+            if literal:
+                return literal
+
+        matches = process.extract(
+            desc,
+            choices,
+            scorer=fuzz.token_set_ratio,
+            processor=None,  # inputs are already preprocessed
+            limit=10,
+            score_cutoff=threshold,
+        )
+
+        return [(questions[idx], score) for _title, score, idx in matches]
+
+    def find_matching_predictions_batch(
+        self,
+        descriptions: List[str],
+        question_set: QuestionSet,
+        threshold: int = 60
+    ) -> List[List[tuple[Dict[str, Any], float]]]:
+        """Score several descriptions against one question set in a single pass.
+
+        process.cdist computes the full queries x titles similarity matrix
+        inside RapidFuzz's C++ core (workers=-1 enables its OpenMP
+        parallelism), which is far cheaper than repeated process.extract
+        calls when batching queries - e.g. future bulk-update tooling.
+        Returns one (question, score) list per description, best first.
+        """
+        questions = question_set.questions
+        if not descriptions or not questions:
+            return [[] for _ in descriptions]
+
+        queries = [default_process(d) for d in descriptions]
+        choices = [self._processed(t) for t in question_set.titles]
+        scores = process.cdist(
+            queries,
+            choices,
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            dtype=np.uint8,
+            workers=-1,
+        )
+
+        results = []
+        for row in scores:
+            idxs = np.argwhere(row >= threshold).ravel()
+            matched = sorted(
+                ((questions[idx], float(row[idx])) for idx in idxs),
+                key=lambda m: m[1],
+                reverse=True,
+            )
+            results.append(matched[:10])
+        return results
+
+# Matching is stateless, so one shared instance is enough
+prediction_matcher = PredictionMatcher()
+
+def _search_keyword(description: str) -> str:
+    """First few significant tokens of a description, for server-side narrowing"""
+    tokens = [t for t in default_process(description).split() if len(t) > 2]
+    return " ".join(tokens[:3])
+
+@cache
+def get_client() -> FatebookClient:
+    """Construct the shared Fatebook client lazily on first use.
+
+    Reading .env and validating the API key happen here rather than at
+    import time, so tooling can import this module (e.g. to enumerate
+    tools) without a configured environment.
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    api_key = os.environ.get("FATEBOOK_API_KEY")
+    if not api_key:
+        raise ValueError("FATEBOOK_API_KEY environment variable is required. Please set it in your .env file or environment.")
+    return FatebookClient(api_key)
 
 # Create the MCP server
 server = Server("fatebook-mcp")
 
-@server.list_tools()
-async def handle_list_tools() -> List[Tool]:
-    """List available tools."""
-    return [
-        Tool(
-            name="list_predictions",
-            description="List all your unresolved Fatebook predictions. The agent should use the returned IDs internally for updates/details without exposing them to the user.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of predictions to return (default: 1000 - all predictions)",
-                        "default": 1000
-                    }
-                },
-                "required": []
+# The tool definitions are fully static, so build them once at import time
+# instead of reallocating the schema dicts on every list_tools call
+_TOOLS: List[Tool] = [
+    Tool(
+        name="list_predictions",
+        description="List all your unresolved Fatebook predictions. The agent should use the returned IDs internally for updates/details without exposing them to the user.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of predictions to return (default: 100, soonest-resolving first; ask for more if needed)",
+                    "default": 100
+                }
             },
-        ),
-        Tool(
-            name="update_prediction",
-            description="Update a prediction probability. The agent should get the question_id from list_predictions and use it here without exposing IDs to the user.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question_id": {
-                        "type": "string",
-                        "description": "The question ID (obtained from list_predictions, not shown to user)"
-                    },
-                    "new_probability": {
-                        "type": "number",
-                        "description": "New probability (0.0 to 1.0)"
-                    },
-                    "comment": {
-                        "type": "string",
-                        "description": "Optional comment explaining the update",
-                        "default": ""
-                    }
-                },
-                "required": ["question_id", "new_probability"]
+            "required": []
+        },
+    ),
+    Tool(
+        name="search_predictions",
+        description="Search your predictions with a natural language description. Returns the best-matching predictions; the agent should use the returned IDs internally without exposing them to the user.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "description": {
+                    "type": "string",
+                    "description": "Natural language description of the prediction to find"
+                }
             },
-        ),
-        Tool(
-            name="get_prediction_details",
-            description="Get detailed information about a specific prediction. The agent should use question_id from list_predictions without exposing it to the user.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "question_id": {
-                        "type": "string",
-                        "description": "The question ID (obtained from list_predictions, not shown to user)"
-                    }
+            "required": ["description"]
+        },
+    ),
+    Tool(
+        name="update_prediction",
+        description="Update a prediction probability. The agent should get the question_id from list_predictions and use it here without exposing IDs to the user.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question_id": {
+                    "type": "string",
+                    "description": "The question ID (obtained from list_predictions, not shown to user)"
+                },
+                "new_probability": {
+                    "type": "number",
+                    "description": "New probability (0.0 to 1.0)"
                 },
-                "required": ["question_id"]
+                "comment": {
+                    "type": "string",
+                    "description": "Optional comment explaining the update",
+                    "default": ""
+                }
             },
-        ),
-    ]
+            "required": ["question_id", "new_probability"]
+        },
+    ),
+    Tool(
+        name="get_prediction_details",
+        description="Get detailed information about a specific prediction. The agent should use question_id from list_predictions without exposing it to the user.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "question_id": {
+                    "type": "string",
+                    "description": "The question ID (obtained from list_predictions, not shown to user)"
+                }
+            },
+            "required": ["question_id"]
+        },
+    ),
+]
+
+@server.list_tools()
+async def handle_list_tools() -> List[Tool]:
+    """List available tools."""
+    return _TOOLS
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
     """Handle tool calls."""
-    
+    fatebook_client = get_client()
+
     if name == "list_predictions":
-        limit = arguments.get("limit", 1000)  # Get all predictions
-        # Default to only your unresolved predictions
-        questions = await fatebook_client.get_questions_with_params(
+        # Soonest-resolving predictions matter most, so sort server-side and
+        # keep the default page small; agents can raise the limit if needed
+        limit = arguments.get("limit", 100)
+        # Default to only your unresolved predictions; stream them so the
+        # full listing is never materialized as one big Python list, and
+        # emit one content item per question so nothing is ever joined into
+        # a single giant string either
+        contents: List[TextContent] = []
+        i = 0
+        async for q in fatebook_client.iter_questions_with_params(
             limit=limit,
             unresolved=True,
-            show_all_public=False  # Only show your own predictions, not public ones
-        )
-        
-        if not questions:
-            return [TextContent(type="text", text="No predictions found.")]
-        
-        result = f"Found {len(questions)} predictions:\n\n"
-        for i, q in enumerate(questions, 1):
+            show_all_public=False,  # Only show your own predictions, not public ones
+            fields=_LIST_FIELDS,
+            sort_earliest_first=True
+        ):
+            i += 1
             try:
                 # Skip if question is None
                 if q is None:
                     logger.warning(f"Skipping None question at index {i}")
                     continue
-                    
-                title = q.get("title", "No title") if q else "No title"
-                question_id = q.get("id", "No ID") if q else "No ID"
-                created_date = q.get("createdDate", "Unknown date") if q else "Unknown date"
-                resolve_by = q.get("resolveBy", "No resolution date") if q else "No resolution date"
-                
-                # Get author information
-                user = q.get("user", {}) if q else {}
-                author_name = user.get("name", "Unknown author") if user else "Unknown author"
-                
-                # Get latest forecast
-                forecasts = q.get("forecasts", []) if q else []
-                latest_forecast = "No forecast"
-                latest_forecaster = ""
-                if forecasts and len(forecasts) > 0:
-                    latest_forecast_data = forecasts[-1]
-                    if latest_forecast_data:
-                        forecast_val = latest_forecast_data.get('forecast', 0)
-                        latest_forecast = format_forecast(forecast_val)
-                        # Get who made the latest forecast
-                        if 'user' in latest_forecast_data and latest_forecast_data['user']:
-                            forecaster = latest_forecast_data['user'].get('name', 'unknown')
-                            latest_forecaster = f" (by {forecaster})"
-                
-                result += f"{i}. **{title}**\n"
-                result += f"   Author: {author_name}\n"
-                result += f"   ID: {question_id}\n"
-                result += f"   Latest forecast: {latest_forecast}{latest_forecaster}\n"
-                result += f"   Resolves by: {resolve_by}\n"
-                result += f"   Created: {created_date}\n\n"
+
+                contents.append(TextContent(type="text", text=_format_question(i, q)))
             except Exception as e:
                 logger.error(f"Error processing question {i}: {e}")
                 logger.error(f"Question data: {q}")
                 continue
-        
-        result += "\n💡 **Note**: This shows only the latest forecast for each prediction. "
-        result += "Use `get_prediction_details` to see all forecasts from different users."
-        
-        return [TextContent(type="text", text=result)]
+
+        if not i:
+            return [TextContent(type="text", text="No predictions found.")]
+
+        contents.insert(0, TextContent(type="text", text=f"Found {i} predictions:\n\n"))
+        contents.append(TextContent(
+            type="text",
+            text="\n💡 **Note**: This shows only the latest forecast for each prediction. "
+                 "Use `get_prediction_details` to see all forecasts from different users."
+        ))
+
+        return contents
     
+    elif name == "search_predictions":
+        description = arguments.get("description", "").strip()
+
+        if not description:
+            return [TextContent(type="text", text="Please provide a description to search for.")]
+
+        # Let the API narrow the candidate set first; only fall back to
+        # fetching (and fuzzy-scoring) everything when it finds nothing
+        keyword = _search_keyword(description)
+        question_set = None
+        if keyword:
+            question_set = await fatebook_client.get_question_set_with_params(
+                limit=25, search_string=keyword
+            )
+        if question_set is None or not question_set.questions:
+            question_set = await fatebook_client.get_question_set_with_params(limit=100)
+        matches = prediction_matcher.find_matching_predictions(description, question_set)
+
+        if not matches:
+            return [TextContent(type="text", text=f"No predictions found matching '{description}'.")]
+
+        parts = [f"Found {len(matches)} matching predictions:\n\n"]
+        for i, (q, score) in enumerate(matches, 1):
+            g = q.get
+            title = g("title") or "No title"
+            question_id = g("id") or "No ID"
+            latest_forecast = _latest_forecast_str(q)
+            parts.append(
+                f"{i}. **{title}** (match: {score:.0f}%)\n"
+                f"   ID: {question_id}\n"
+                f"   Latest forecast: {latest_forecast}\n\n"
+            )
+
+        return [TextContent(type="text", text="".join(parts))]
+
     elif name == "update_prediction":
-        question_id = arguments.get("question_id", "")
-        new_probability = arguments.get("new_probability", 0)
+        # Validate everything before any network I/O so malformed args cost nothing
+        question_id = arguments.get("question_id", "").strip()
         comment = arguments.get("comment", "")
-        
+
         if not question_id:
             return [TextContent(type="text", text="Please provide a question ID to update.")]
-        
+
+        try:
+            new_probability = float(arguments.get("new_probability", 0))
+        except (TypeError, ValueError):
+            return [TextContent(type="text", text="Probability must be a number between 0.0 and 1.0.")]
+
         if not (0 <= new_probability <= 1):
             return [TextContent(type="text", text="Probability must be between 0.0 and 1.0.")]
-        
-        # Get question details to show the title
-        question = await fatebook_client.get_question_by_id(question_id)
+
+        # The title fetch is display-only, so it can run concurrently with
+        # the forecast update instead of serializing two round-trips
+        question, success = await asyncio.gather(
+            fatebook_client.get_question_by_id(question_id),
+            fatebook_client.add_forecast(question_id, new_probability, comment),
+        )
+        if success:
+            # The concurrent title fetch can finish after add_forecast's
+            # invalidation and re-cache a pre-update snapshot; drop it again
+            # so get_prediction_details never hides the forecast just added
+            fatebook_client.invalidate_question(question_id)
         if not question:
             return [TextContent(type="text", text=f"Question with ID '{question_id}' not found.")]
-        
+
         title = question.get("title", "No title")
-        
-        # Update the prediction
-        success = await fatebook_client.add_forecast(question_id, new_probability, comment)
-        
+
         if success:
-            result = "✅ Successfully updated prediction:\n\n"
-            result += f"**{title}**\n"
-            result += f"ID: {question_id}\n"
-            result += f"New forecast: {new_probability * 100:.1f}%"
+            result = (
+                "✅ Successfully updated prediction:\n\n"
+                f"**{title}**\n"
+                f"ID: {question_id}\n"
+                f"New forecast: {new_probability * 100:.1f}%"
+            )
             if comment:
                 result += f"\nComment: {comment}"
         else:
-            result = "❌ Failed to update prediction:\n\n"
-            result += f"**{title}** (ID: {question_id})"
-        
+            result = f"❌ Failed to update prediction:\n\n**{title}** (ID: {question_id})"
+
         return [TextContent(type="text", text=result)]
     
     elif name == "get_prediction_details":
@@ -300,43 +728,66 @@ async def handle_call_tool(name: str, arguments: dict) -> List[TextContent]:
         resolution = question.get("resolution", "")
         
         # Get author information
-        user = question.get("user", {})
+        user = question.get("user") or _EMPTY
         author_name = user.get("name", "Unknown author")
         
-        result = f"**{title}**\n\n"
-        result += f"Author: {author_name}\n"
-        result += f"ID: {question_id}\n"
-        result += f"Created: {created_date}\n"
-        result += f"Resolves by: {resolve_by}\n"
-        result += f"Status: {'Resolved' if resolved else 'Open'}\n"
-        
+        parts = [
+            f"**{title}**\n\n"
+            f"Author: {author_name}\n"
+            f"ID: {question_id}\n"
+            f"Created: {created_date}\n"
+            f"Resolves by: {resolve_by}\n"
+            f"Status: {'Resolved' if resolved else 'Open'}\n"
+        ]
+
         if resolved and resolution:
-            result += f"Resolution: {resolution}\n"
-        
+            parts.append(f"Resolution: {resolution}\n")
+
         # Show forecast history
-        forecasts = question.get("forecasts", [])
+        forecasts = question.get("forecasts") or ()
         if forecasts:
-            result += f"\nForecast history ({len(forecasts)} forecasts, showing last 5):\n"
-            for i, forecast in enumerate(forecasts[-5:], 1):  # Show last 5 forecasts
+            parts.append(f"\nForecast history ({len(forecasts)} forecasts, showing last 5):\n")
+            # Take the last 5 without copying the whole tail of a long history
+            tail = list(islice(reversed(forecasts), 5))[::-1]
+            for i, forecast in enumerate(tail, 1):
                 if forecast is None:
                     continue
                 forecast_val = forecast.get("forecast", 0)
                 forecast_str = format_forecast(forecast_val)
-                forecast_date = forecast.get("createdDate", "Unknown date")
-                forecaster_name = "Unknown"
-                if 'user' in forecast and forecast['user']:
-                    forecaster_name = forecast['user'].get('name', 'Unknown')
-                result += f"  {i}. {forecast_str} by {forecaster_name} on {forecast_date}\n"
-        
-        return [TextContent(type="text", text=result)]
+                forecast_date = forecast.get("createdDate") or "Unknown date"
+                u = forecast.get("user")
+                forecaster_name = (u.get("name") if u else None) or "Unknown"
+                parts.append(f"  {i}. {forecast_str} by {forecaster_name} on {forecast_date}\n")
+
+        return [TextContent(type="text", text="".join(parts))]
     
     else:
         return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
+async def _prefetch():
+    """Warm the listing cache so the first list_predictions call is instant"""
+    try:
+        await get_client().get_questions_with_params(
+            limit=100,
+            unresolved=True,
+            show_all_public=False,
+            fields=_LIST_FIELDS,
+            sort_earliest_first=True
+        )
+    except Exception as e:
+        # Purely an optimization; the first tool call just pays full latency
+        logger.debug("Prefetch failed: %s", e)
+
 async def main():
     # Run the server using stdin/stdout streams
     from mcp.server.stdio import stdio_server
-    
+
+    # Pre-fetch the default listing in the background while the MCP
+    # handshake happens, so the first user turn hits a warm cache. The
+    # reference must be kept - the event loop only holds tasks weakly,
+    # and an unreferenced task can be garbage-collected mid-flight
+    prefetch_task = asyncio.create_task(_prefetch())  # noqa: F841
+
     async with stdio_server() as (read_stream, write_stream):
         await server.run(
             read_stream,
@@ -352,4 +803,11 @@ async def main():
         )
 
 if __name__ == "__main__":
+    try:
+        # libuv-backed event loop cuts per-call overhead for the many small
+        # httpx requests this server makes; not available on Windows
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     asyncio.run(main())
\ No newline at end of file
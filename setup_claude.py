@@ -8,6 +8,13 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    # Same fast JSON codec the server uses; fall back to stdlib json so
+    # setup still works before the requirements are installed
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -35,8 +42,8 @@ def setup_claude_config():
     
     # Load existing config or create new one
     if claude_config_file.exists():
-        with open(claude_config_file, 'r') as f:
-            config = json.load(f)
+        raw = claude_config_file.read_bytes()
+        config = orjson.loads(raw) if orjson is not None else json.loads(raw)
     else:
         config = {
             "mcpServers": {}
@@ -50,8 +57,10 @@ def setup_claude_config():
     config["mcpServers"]["fatebook"] = fatebook_config
     
     # Write config back
-    with open(claude_config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        claude_config_file.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    else:
+        claude_config_file.write_text(json.dumps(config, indent=2))
     
     print("✓ Claude Desktop configuration updated!")
     print(f"  Config file: {claude_config_file}")
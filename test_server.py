@@ -5,39 +5,42 @@ Test script for the Fatebook MCP Server
 
 import asyncio
 import os
+import time
 from dotenv import load_dotenv
-from server import FatebookClient
+from server import get_client, _latest_forecast_str
 
 # Load environment variables
 load_dotenv()
 
 async def test_fatebook_api():
-    """Test the Fatebook API connection"""
+    """Test the Fatebook API connection (run as a script; needs a real API key)"""
     print("Testing Fatebook API connection...")
-    
+
     api_key = os.environ.get("FATEBOOK_API_KEY")
     if not api_key:
         print("Error: FATEBOOK_API_KEY not found in environment variables")
         return
-        
-    client = FatebookClient(api_key)
+
+    # Reuse the server's shared client so all calls go over one pooled
+    # HTTP/2 connection instead of paying a fresh TLS handshake here
+    client = get_client()
     
     try:
-        # Test getting questions with different parameters
-        print("Testing basic getQuestions...")
-        questions = await client.get_questions(limit=5)
+        # The three variant calls are independent, so fire them concurrently;
+        # with HTTP/2 they multiplex over a single connection
+        print("Testing getQuestions variants (concurrently)...")
+        start = time.perf_counter()
+        questions, questions_public, questions_unresolved = await asyncio.gather(
+            client.get_questions(limit=5),
+            client.get_questions_with_params(limit=5, show_all_public=True),
+            client.get_questions_with_params(limit=5, unresolved=True),
+        )
+        elapsed = time.perf_counter() - start
         print(f"✓ Basic call retrieved {len(questions)} questions")
-        
-        # Test with showAllPublic flag
-        print("Testing with showAllPublic...")
-        questions_public = await client.get_questions_with_params(limit=5, show_all_public=True)
         print(f"✓ Public questions call retrieved {len(questions_public)} questions")
-        
-        # Test with unresolved filter
-        print("Testing with unresolved filter...")
-        questions_unresolved = await client.get_questions_with_params(limit=5, unresolved=True)
         print(f"✓ Unresolved questions call retrieved {len(questions_unresolved)} questions")
-        
+        print(f"✓ All three variants completed in {elapsed * 1000:.0f} ms")
+
         # Use the best result set for further testing
         all_questions = questions or questions_public or questions_unresolved
         questions = all_questions
@@ -59,15 +62,8 @@ async def test_fatebook_api():
         for i, q in enumerate(questions[:3], 1):
             title = q.get("title", "No title")
             question_id = q.get("id", "No ID")
-            forecasts = q.get("forecasts", [])
-            latest_forecast = "No forecast"
-            if forecasts:
-                forecast_val = forecasts[-1].get('forecast', 0)
-                if isinstance(forecast_val, (int, float)):
-                    latest_forecast = f"{forecast_val * 100:.1f}%"
-                else:
-                    latest_forecast = str(forecast_val)
-            
+            latest_forecast = _latest_forecast_str(q)
+
             print(f"\n{i}. {title}")
             print(f"   ID: {question_id}")
             print(f"   Current forecast: {latest_forecast}")
@@ -78,5 +74,8 @@ async def test_fatebook_api():
     finally:
         await client.close()
 
+# Live-API script, not a pytest case; keep pytest from collecting it
+test_fatebook_api.__test__ = False
+
 if __name__ == "__main__":
     asyncio.run(test_fatebook_api())
\ No newline at end of file
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for FatebookClient's streaming listing path (no network required)
+"""
+
+import asyncio
+
+import httpx
+
+from server import FatebookClient
+
+PAYLOAD = b'{"items": [{"id": "q1", "title": "First"}, {"id": "q2", "title": "Second"}]}'
+
+
+def make_client() -> FatebookClient:
+    """A FatebookClient whose transport serves a canned getQuestions payload"""
+    client = FatebookClient("test-key")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, content=PAYLOAD))
+    client.client = httpx.AsyncClient(transport=transport, base_url="https://fatebook.io/api")
+    return client
+
+
+def test_iter_questions_cold_cache():
+    """The streaming path must yield items on a cache miss, not only on hits"""
+    client = make_client()
+
+    async def run():
+        items = [q async for q in client.iter_questions_with_params(limit=5)]
+        await client.close()
+        return items
+
+    items = asyncio.run(run())
+    assert [q["id"] for q in items] == ["q1", "q2"]
+
+
+def test_iter_questions_matches_list_variant():
+    """Streaming and list fetches of the same payload must agree"""
+    client = make_client()
+
+    async def run():
+        streamed = [q async for q in client.iter_questions_with_params(limit=5)]
+        client._list_cache.clear()  # force the list variant to re-fetch
+        listed = await client.get_questions_with_params(limit=5)
+        await client.close()
+        return streamed, listed
+
+    streamed, listed = asyncio.run(run())
+    assert streamed == listed
+
+
+if __name__ == "__main__":
+    test_iter_questions_cold_cache()
+    test_iter_questions_matches_list_variant()
+    print("✓ Streaming listing tests passed")